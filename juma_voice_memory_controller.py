@@ -12,11 +12,25 @@ Developed by extrememan-fin OH2DDG with technical assistance from OH7SV.
 """
 
 import json
-import platform
+import queue
 import re
+import threading
+import time
 from pathlib import Path
 
-import customtkinter as ctk
+from customtkinter import (
+    CTk,
+    CTkButton,
+    CTkCanvas,
+    CTkFont,
+    CTkFrame,
+    CTkLabel,
+    CTkOptionMenu,
+    CTkSegmentedButton,
+    StringVar,
+    set_appearance_mode,
+    set_default_color_theme,
+)
 
 try:
     import serial
@@ -30,6 +44,9 @@ CONFIG_PATH = Path.home() / ".juma_rs232_gui.json"
 BAUD_RATES = [300, 600, 1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200]
 DEFAULT_BAUD = 9600
 TIMEOUT = 1.0
+TX_COALESCE_MS = 5     # pending writes within this window go out as one
+COMMAND_SHOW_S = 5.0   # last command stays visible this long
+OPEN_POLL_MS = 20      # how often the UI checks for a finished port open
 
 # Compact metrics
 RADIUS = 6
@@ -43,59 +60,100 @@ GAP   = 3
 FONT_BTN_SIZE = 10
 FONT_LBL_SIZE = 9
 
+# Keyboard hotkeys (sent verbatim as commands)
+_HOTKEYS = frozenset("MRPTS0123456789")
+_CMD_BYTES = {c: c.encode("ascii") for c in _HOTKEYS}
+# Status text shown after each function command (Stop returns to Idle)
+_CMD_STATUS = {"M": "MIC record", "R": "RX record", "P": "Play", "T": "Transmit"}
 
+# Serial port name patterns used by find_default_port
+_USB_PAT = re.compile(r"usb(serial|modem)", re.I)
+_LINUX_TTY_PAT = re.compile(r"/dev/tty(USB|ACM)\d+")
+_WIN_COM_PAT = re.compile(r"^COM\d+$", re.I)
+
+
+
+
+# Modern Dark (balanced & calm). Same across modes for consistency.
+_PALETTE = {
+    "muted": ("#6b7280"),
+    "rec":   ("#E74C3C", "#D64232"),   # MIC record
+    "rxrec": ("#E67E22", "#CF711E"),   # RX record
+    "play":  ("#27AE60", "#1F8F4F"),   # Play
+    "stop":  ("#2980B9", "#2279A1"),   # Stop
+    "tx_fg": ("#C0392B", "#A93226"),   # Transmit fill
+    "tx_border": "#E74C3C",            # Transmit border accent
+    "tx_text": "#ffffff",
+    "num":   ("#2980B9", "#2279A1", "#1B5E85"),  # (normal, hover, active) — matches Stop   # numeric keypad stays blue
+    "status_ok": "#27AE60",
+    "status_idle": "#9CA3AF",
+    "status_err": "#E74C3C",
+}
+_PALETTES = {"Light": _PALETTE, "Dark": _PALETTE}
 
 
 def palette(mode: str) -> dict:
-    # Modern Dark (balanced & calm). Same across modes for consistency.
-    return {
-        "muted": ("#6b7280"),
-        "rec":   ("#E74C3C", "#D64232"),   # MIC record
-        "rxrec": ("#E67E22", "#CF711E"),   # RX record
-        "play":  ("#27AE60", "#1F8F4F"),   # Play
-        "stop":  ("#2980B9", "#2279A1"),   # Stop
-        "tx_fg": ("#C0392B", "#A93226"),   # Transmit fill
-        "tx_border": "#E74C3C",            # Transmit border accent
-        "tx_text": "#ffffff",
-        "num":   ("#2980B9", "#2279A1", "#1B5E85"),  # (normal, hover, active) — matches Stop   # numeric keypad stays blue
-        "status_ok": "#27AE60",
-        "status_idle": "#9CA3AF",
-        "status_err": "#E74C3C",
-    }
+    # Precomputed per mode; treat the returned dict as read-only.
+    return _PALETTES.get(mode, _PALETTE)
+
+
 
 
+# Last config seen on disk: file mtime, parsed dict and serialized text.
+_cfg_cache = {"mtime": None, "data": None, "raw": None}
 
 
 def load_cfg():
     try:
-        return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+        if mtime == _cfg_cache["mtime"] and _cfg_cache["data"] is not None:
+            return dict(_cfg_cache["data"])
+        raw = CONFIG_PATH.read_text(encoding="utf-8")
+        data = json.loads(raw)
+        _cfg_cache.update(mtime=mtime, data=data, raw=raw)
+        return dict(data)
     except Exception:
         return {}
 
 
 def save_cfg(cfg: dict):
     try:
-        CONFIG_PATH.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+        new_raw = json.dumps(cfg, indent=2)
+        if new_raw == _cfg_cache["raw"]:
+            try:
+                on_disk = CONFIG_PATH.stat().st_mtime_ns
+            except OSError:
+                on_disk = None
+            if on_disk is not None and on_disk == _cfg_cache["mtime"]:
+                return  # file unchanged since last load/save
+        CONFIG_PATH.write_text(new_raw, encoding="utf-8")
+        _cfg_cache.update(mtime=CONFIG_PATH.stat().st_mtime_ns,
+                          data=dict(cfg), raw=new_raw)
     except Exception:
         pass
 
 
-def find_default_port() -> str:
-    ports = [p.device for p in (list_ports.comports() if list_ports else [])]
+def find_default_port(ports=None) -> str:
+    if ports is None:
+        devices = tuple(p.device for p in (list_ports.comports() if list_ports else ()))
+    else:
+        devices = ports
+    first = devices[0] if devices else None
+    import platform  # only needed here
     sysname = platform.system()
+    # one pass over the devices per platform, no intermediate lists
     if sysname == "Darwin":
-        prefer = [p for p in ports if "/dev/cu." in p]
-        prefer.sort(key=lambda x: (not re.search(r"usb(serial|modem)", x, re.I), x))
-        return (prefer or ports or ["/dev/cu.usbserial"])[0]
+        prefer = min((p for p in devices if "/dev/cu." in p),
+                     key=lambda x: (not _USB_PAT.search(x), x), default=None)
+        return prefer or first or "/dev/cu.usbserial"
     if sysname == "Linux":
-        pref = [p for p in ports if re.search(r"/dev/tty(USB|ACM)\d+", p)]
-        pref.sort()
-        return (pref or ports or ["/dev/ttyUSB0"])[0]
-    win = [p for p in ports if re.match(r"^COM\d+$", p, re.I)]
-    return (win or ports or ["COM3"])[0]
+        pref = min(filter(_LINUX_TTY_PAT.search, devices), default=None)
+        return pref or first or "/dev/ttyUSB0"
+    win = next(filter(_WIN_COM_PAT.match, devices), None)
+    return win or first or "COM3"
 
 
-class CompactButton(ctk.CTkFrame):
+class CompactButton(CTkFrame):
     """Compact button with hover and active press effects."""
     def __init__(self, master, text, command, fg_color, hover_color, active_color=None,
                  width=78, height=24, radius=6, font=None, text_color="white"):
@@ -106,13 +164,22 @@ class CompactButton(ctk.CTkFrame):
         self._command = command
         self.configure(width=width, height=height)
         self.grid_propagate(False)
-        self.label = ctk.CTkLabel(self, text=text, font=font, text_color=text_color)
+        self.label = CTkLabel(self, text=text, font=font, text_color=text_color)
         self.label.place(relx=0.5, rely=0.5, anchor="center")
         for w in (self, self.label):
-            w.bind("<Enter>", lambda e: self.configure(fg_color=self._hover))
-            w.bind("<Leave>", lambda e: self.configure(fg_color=self._normal))
+            w.bind("<Enter>", self._on_enter)
+            w.bind("<Leave>", self._on_leave)
             w.bind("<Button-1>", self._on_press)
             w.bind("<ButtonRelease-1>", self._on_release)
+    def set_colors(self, fg_color, hover_color, active_color=None):
+        self._normal = fg_color
+        self._hover = hover_color
+        self._active = active_color or hover_color
+        self.configure(fg_color=fg_color)
+    def _on_enter(self, _):
+        self.configure(fg_color=self._hover)
+    def _on_leave(self, _):
+        self.configure(fg_color=self._normal)
     def _on_press(self, _):
         self.configure(fg_color=self._active)
     def _on_release(self, _):
@@ -120,7 +187,7 @@ class CompactButton(ctk.CTkFrame):
         if callable(self._command):
             self._command()
 
-class App(ctk.CTk):
+class App(CTk):
     def __init__(self):
         super().__init__()
         self.title(APP_TITLE)
@@ -131,21 +198,28 @@ class App(ctk.CTk):
 
         self.cfg = load_cfg()
         self.appearance = self.cfg.get("theme", "Light")
-        ctk.set_appearance_mode(self.appearance)
-        ctk.set_default_color_theme("blue")
+        set_appearance_mode(self.appearance)
+        set_default_color_theme("blue")
         self.colors = palette(self.appearance)
 
-        self.FONT_BTN = ctk.CTkFont(size=FONT_BTN_SIZE, weight="bold")
-        self.FONT_LBL = ctk.CTkFont(size=FONT_LBL_SIZE)
+        self.FONT_BTN = CTkFont(size=FONT_BTN_SIZE, weight="bold")
+        self.FONT_LBL = CTkFont(size=FONT_LBL_SIZE)
 
         self.ser = None
-        self.port_var = ctk.StringVar(value="")
-        self.baud_var = ctk.StringVar(value=str(self.cfg.get("baud", DEFAULT_BAUD)))
-        self.status_var = ctk.StringVar(value="Idle")
+        self._opening = False  # serial open running in the background
+        self._open_results = queue.Queue()  # (port, baud, Serial or exception)
+        self._open_poll_after = None
+        self._tx_buf = bytearray()
+        self._tx_flush_after = None
+        self.port_var = StringVar(value="")
+        self.baud_var = StringVar(value=str(self.cfg.get("baud", DEFAULT_BAUD)))
+        self.status_var = StringVar(value="Idle")
+        self._last_status_text = "Idle"
         this = self  # for lambda capture friendliness (no-op)
 
-        self.command_var = ctk.StringVar(value="")
-        self._command_clear_after = None
+        self.command_var = StringVar(value="")
+        self._command_clear_deadline = 0.0
+        self._command_clear_scheduled = False
 
         # Top header
         self._build_topbar()
@@ -166,22 +240,22 @@ class App(ctk.CTk):
 
     # ---------- Top bar ----------
     def _build_topbar(self):
-        bar = ctk.CTkFrame(self, corner_radius=RADIUS)
+        bar = CTkFrame(self, corner_radius=RADIUS)
         bar.pack(side="top", fill="x", padx=PAD_X, pady=(PAD_Y, GAP))
 
-        inner = ctk.CTkFrame(bar, fg_color="transparent")
+        inner = CTkFrame(bar, fg_color="transparent")
         inner.pack(side="top", fill="x", padx=PAD_X, pady=(PAD_Y, PAD_Y))
 
-        ctk.CTkLabel(inner, text="Port:", font=self.FONT_LBL).pack(side="left", padx=(0, 4))
-        self.port_menu = ctk.CTkOptionMenu(inner, variable=self.port_var, values=[], width=160, height=20, font=self.FONT_BTN)
+        CTkLabel(inner, text="Port:", font=self.FONT_LBL).pack(side="left", padx=(0, 4))
+        self.port_menu = CTkOptionMenu(inner, variable=self.port_var, values=[], width=160, height=20, font=self.FONT_BTN)
         self.port_menu.pack(side="left", padx=(0, 6))
 
-        ctk.CTkLabel(inner, text="Baud:", font=self.FONT_LBL).pack(side="left", padx=(0, 4))
-        self.baud_menu = ctk.CTkOptionMenu(inner, variable=self.baud_var, values=[str(b) for b in BAUD_RATES], width=90, height=20, font=self.FONT_BTN)
+        CTkLabel(inner, text="Baud:", font=self.FONT_LBL).pack(side="left", padx=(0, 4))
+        self.baud_menu = CTkOptionMenu(inner, variable=self.baud_var, values=[str(b) for b in BAUD_RATES], width=90, height=20, font=self.FONT_BTN)
         self.baud_menu.pack(side="left", padx=(0, 6))
 
         # Open/Close button as CompactButton to avoid text clipping
-        self.open_btn = ctk.CTkButton(
+        self.open_btn = CTkButton(
             inner,
             text="Open",
             width=112,
@@ -194,29 +268,30 @@ class App(ctk.CTk):
 
     # ---------- Status row (Status • Command • Theme) ----------
     def _build_status_row(self):
-        row = ctk.CTkFrame(self, fg_color="transparent")
+        row = CTkFrame(self, fg_color="transparent")
         row.pack(side="top", fill="x", padx=PAD_X, pady=(0, GAP))
 
         # Left group
-        left = ctk.CTkFrame(row, fg_color="transparent")
+        left = CTkFrame(row, fg_color="transparent")
         left.pack(side="left")
-        ctk.CTkLabel(left, text="Status:", font=ctk.CTkFont(weight="bold", size=10)).pack(side="left")
+        CTkLabel(left, text="Status:", font=self.FONT_BTN).pack(side="left")
         bg = self._apply_appearance_mode(self.cget("fg_color"))
-        self.dot = ctk.CTkCanvas(left, width=7, height=7, highlightthickness=0, bg=bg, bd=0)
+        self.dot = CTkCanvas(left, width=7, height=7, highlightthickness=0, bg=bg, bd=0)
         self.dot_id = self.dot.create_oval(1, 1, 6, 6, fill=self.colors["status_idle"], outline=bg)
         self.dot.pack(side="left", padx=5)
-        self.status_lbl = ctk.CTkLabel(left, textvariable=self.status_var, font=self.FONT_LBL)
+        self.status_lbl = CTkLabel(left, textvariable=self.status_var, font=self.FONT_LBL)
         self.status_lbl.pack(side="left")
 
         # Center group
-        center = ctk.CTkFrame(row, fg_color="transparent")
+        center = CTkFrame(row, fg_color="transparent")
         center.pack(side="left", fill="x", expand=True, padx=(10, 0))
-        ctk.CTkLabel(center, text="Command:", text_color=self.colors["muted"], font=self.FONT_LBL).pack(side="left")
-        self.command_lbl = ctk.CTkLabel(center, textvariable=self.command_var, font=self.FONT_LBL)
+        self.command_title_lbl = CTkLabel(center, text="Command:", text_color=self.colors["muted"], font=self.FONT_LBL)
+        self.command_title_lbl.pack(side="left")
+        self.command_lbl = CTkLabel(center, textvariable=self.command_var, font=self.FONT_LBL)
         self.command_lbl.pack(side="left", padx=(5, 0))
 
         # Theme next to Command — smaller and aligned
-        self.theme_btn = ctk.CTkSegmentedButton(center, values=["Light", "Dark"], height=16, width=84, command=self._toggle_theme, font=self.FONT_BTN)
+        self.theme_btn = CTkSegmentedButton(center, values=["Light", "Dark"], height=16, width=84, command=self._toggle_theme, font=self.FONT_BTN)
         self.theme_btn.set(self.appearance)
         self.theme_btn.pack(side="right", padx=(0, 0))
 
@@ -224,61 +299,59 @@ class App(ctk.CTk):
 
     # ---------- Body ----------
     def _build_body(self):
-        body = ctk.CTkFrame(self, corner_radius=RADIUS, fg_color="transparent")
+        body = CTkFrame(self, corner_radius=RADIUS, fg_color="transparent")
         body.pack(side="top", fill="x", expand=False, padx=PAD_X, pady=(0, 0))
 
         # Left actions
-        left = ctk.CTkFrame(body, fg_color="transparent", width=135)
+        left = CTkFrame(body, fg_color="transparent", width=135)
         left.pack(side="left", padx=(GAP, GAP), pady=(GAP, 0), fill="y")
 
-        def _act_btn(parent, text, cmd, color_pair=None, **kw):
-            style = dict(font=self.FONT_BTN, height=BTN_H_FUNC, corner_radius=RADIUS)
-            if color_pair:
-                style.update(dict(fg_color=color_pair[0], hover_color=color_pair[1]))
-            style.update(kw)
-            btn = ctk.CTkButton(parent, text=text, command=cmd, **style)
+        # (button, palette key) pairs, restyled in place on theme change
+        self.action_btns = []
+
+        def _act_btn(parent, text, cmd, key, **kw):
+            colors = self.colors[key]
+            btn = CTkButton(parent, text=text, command=cmd, font=self.FONT_BTN, height=BTN_H_FUNC,
+                            corner_radius=RADIUS, fg_color=colors[0], hover_color=colors[1], **kw)
             btn.pack(fill="x", padx=GAP, pady=(GAP, 0))
+            self.action_btns.append((btn, key))
             return btn
 
-        _act_btn(left, "MIC record", lambda: self.send("M"), self.colors["rec"])
-        _act_btn(left, "RX record",  lambda: self.send("R"), self.colors["rxrec"])
-        _act_btn(left, "Play",       lambda: self.send("P"), self.colors["play"])
-        self.tx_btn = _act_btn(left, "Transmit", lambda: self.send("T"),
-                               (self.colors["tx_fg"][0], self.colors["tx_fg"][1]),
+        _act_btn(left, "MIC record", lambda: self.send("M"), "rec")
+        _act_btn(left, "RX record",  lambda: self.send("R"), "rxrec")
+        _act_btn(left, "Play",       lambda: self.send("P"), "play")
+        self.tx_btn = _act_btn(left, "Transmit", lambda: self.send("T"), "tx_fg",
                                border_width=2, border_color=self.colors["tx_border"],
                                text_color=self.colors["tx_text"])
-        _act_btn(left, "Stop",       lambda: self.send("S"), self.colors["stop"])
+        _act_btn(left, "Stop",       lambda: self.send("S"), "stop")
 
         # Right keypad
-        right = ctk.CTkFrame(body, fg_color="transparent")
+        right = CTkFrame(body, fg_color="transparent")
         right.pack(side="left", padx=(GAP, 0), pady=(GAP, 0))
 
-        grid = ctk.CTkFrame(right, fg_color="transparent")
+        grid = CTkFrame(right, fg_color="transparent")
         grid.pack(side="top", padx=0, pady=(0, 0))
 
         numc = self.colors["num"]
         btn_w = 78  # tuned to align with right edge
         nums = [["1","2","3"],["4","5","6"],["7","8","9"]]
+        self.keypad_btns = {}
         for r, row in enumerate(nums):
-            row_frame = ctk.CTkFrame(grid, fg_color="transparent")
-            row_frame.pack(side="top", pady=(GAP, 0))  # same vertical rhythm as left buttons
             for c, label in enumerate(row):
-                b = CompactButton(row_frame, text=label, command=lambda n=label: self.send(n),
+                b = CompactButton(grid, text=label, command=lambda n=label: self.send(n),
                                   fg_color=numc[0], hover_color=numc[1],
                                   width=btn_w, height=BTN_H_NUM, radius=RADIUS, font=self.FONT_BTN)
-                b.pack(side="left", padx=(0 if c == 0 else GAP, 0))
+                # same vertical rhythm as left buttons
+                b.grid(row=r, column=c, padx=(0 if c == 0 else GAP, 0), pady=(GAP, 0))
+                self.keypad_btns[label] = b
 
-        # 0 centered
-        row0 = ctk.CTkFrame(grid, fg_color="transparent")
-        row0.pack(side="top", pady=(GAP, 0))
-        spacer_w = btn_w
-        ctk.CTkFrame(row0, width=spacer_w, height=BTN_H_NUM, fg_color="transparent").pack(side="left")
-        b0 = CompactButton(row0, text="0", command=lambda: self.send("0"), fg_color=numc[0], hover_color=numc[1], width=btn_w, height=BTN_H_NUM, radius=RADIUS, font=self.FONT_BTN, active_color=self.colors["num"][2])
-        b0.pack(side="left", padx=GAP)
-        ctk.CTkFrame(row0, width=spacer_w, height=BTN_H_NUM, fg_color="transparent").pack(side="left")
+        # 0 centered (middle column)
+        b0 = CompactButton(grid, text="0", command=lambda: self.send("0"), fg_color=numc[0], hover_color=numc[1], width=btn_w, height=BTN_H_NUM, radius=RADIUS, font=self.FONT_BTN, active_color=self.colors["num"][2])
+        b0.grid(row=3, column=1, padx=(GAP, 0), pady=(GAP, 0))
+        self.keypad_btns["0"] = b0
 
         # Hotkeys centered
-        self.hotkeys_lbl = ctk.CTkLabel(
+        self.hotkeys_lbl = CTkLabel(
             right,
             text="Hotkeys: M R P T S, digits 1–9",
             text_color=self.colors["muted"],
@@ -290,30 +363,37 @@ class App(ctk.CTk):
 
     # ---------- Theme ----------
     def _toggle_theme(self, mode: str):
-        ctk.set_appearance_mode(mode)
+        set_appearance_mode(mode)
         self.appearance = mode
         self.colors = palette(mode)
         self.cfg["theme"] = mode
         save_cfg(self.cfg)
-        # simple rebuild (fixed layout)
-        for w in self.winfo_children():
-            w.destroy()
-        self._build_topbar()
-        self._build_status_row()
-        self._build_body()
-        self._bind_hotkeys()
-        self.refresh_ports(select_default=False)
+        # restyle existing widgets in place (fixed layout, ports unchanged)
+        for btn, key in self.action_btns:
+            btn.configure(fg_color=self.colors[key][0], hover_color=self.colors[key][1])
+        self.tx_btn.configure(border_color=self.colors["tx_border"], text_color=self.colors["tx_text"])
+        numc = self.colors["num"]
+        for label, b in self.keypad_btns.items():
+            b.set_colors(numc[0], numc[1], numc[2] if label == "0" else None)
+        self.hotkeys_lbl.configure(text_color=self.colors["muted"])
+        self.command_title_lbl.configure(text_color=self.colors["muted"])
+        bg = self._apply_appearance_mode(self.cget("fg_color"))
+        self.dot.configure(bg=bg)
+        self.dot.itemconfig(self.dot_id, outline=bg)
+        self._update_status_dot(self._status_state)
 
     # ---------- Hotkeys ----------
     def _bind_hotkeys(self):
-        for key, ch in [("m","M"),("r","R"),("p","P"),("t","T"),("s","S")]:
-            self.bind(f"<Key-{key}>", lambda e, c=ch: self.send(c))
-            self.bind(f"<Key-{key.upper()}>", lambda e, c=ch: self.send(c))
-        for d in "0123456789":
-            self.bind(f"<Key-{d}>", lambda e, c=d: self.send(c))
+        self.bind("<Key>", self._on_hotkey)
+
+    def _on_hotkey(self, event):
+        ch = (event.char or "").upper()
+        if ch in _HOTKEYS:
+            self.send(ch)
 
     # ---------- Status helpers ----------
     def _update_status_dot(self, state: str):
+        self._status_state = state
         try:
             color = self.colors["status_idle"]
             if state == "ok":
@@ -325,7 +405,9 @@ class App(ctk.CTk):
             pass
 
     def _set_status(self, text: str, state: str | None = None):
-        self.status_var.set(text)
+        if text != self._last_status_text:
+            self._last_status_text = text
+            self.status_var.set(text)
         if state is None:
             t = (text or "").lower()
             if t.startswith("connected"):
@@ -345,7 +427,7 @@ class App(ctk.CTk):
             return
         ports = [p.device for p in list_ports.comports()]
         if select_default and ports:
-            self.port_var.set(find_default_port())
+            self.port_var.set(find_default_port(ports))
         elif ports and not self.port_var.get():
             self.port_var.set(ports[0])
         try:
@@ -354,6 +436,8 @@ class App(ctk.CTk):
             pass
 
     def toggle_port(self):
+        if self._opening:
+            return
         if self.ser and self.ser.is_open:
             self.close_port()
         else:
@@ -370,21 +454,57 @@ class App(ctk.CTk):
             return
         try:
             baud = int(self.baud_var.get() or DEFAULT_BAUD)
-            self.ser = serial.Serial(port, baudrate=baud, timeout=TIMEOUT)
-            self._set_status(f"Connected: {port} @ {baud}", state="ok")
-            # change button label to Close
-            self.open_btn.configure(text="Close")
-            self.cfg["port"] = port
-            self.cfg["baud"] = baud
-            save_cfg(self.cfg)
         except Exception as e:
-            self._set_status(f"Open failed: {e}", state="error")
+            self._open_port_done(port, None, e)
+            return
+        # opening a USB VCP can block for a while; keep the UI responsive.
+        # The worker never touches Tk; results are polled from the Tk thread.
+        self._opening = True
+        self._set_status("Opening…", state="idle")
+        self.open_btn.configure(text="Opening…", state="disabled")
+        try:
+            threading.Thread(target=self._open_port_worker, args=(port, baud), daemon=True).start()
+        except Exception as e:
+            self._open_port_done(port, baud, e)
+            return
+        self._open_poll_after = self.after(OPEN_POLL_MS, self._poll_open_port)
+
+    def _open_port_worker(self, port: str, baud: int):
+        try:
+            result = serial.Serial(port, baudrate=baud, timeout=TIMEOUT)
+        except Exception as e:
+            result = e
+        self._open_results.put((port, baud, result))
+
+    def _poll_open_port(self):
+        try:
+            port, baud, result = self._open_results.get_nowait()
+        except queue.Empty:
+            self._open_poll_after = self.after(OPEN_POLL_MS, self._poll_open_port)
+            return
+        self._open_poll_after = None
+        self._open_port_done(port, baud, result)
+
+    def _open_port_done(self, port: str, baud, result):
+        self._opening = False
+        self.open_btn.configure(state="normal")
+        if isinstance(result, Exception):
+            self._set_status(f"Open failed: {result}", state="error")
             self.ser = None
             self.open_btn.configure(text="Open")
+            return
+        self.ser = result
+        self._set_status(f"Connected: {port} @ {baud}", state="ok")
+        # change button label to Close
+        self.open_btn.configure(text="Close")
+        self.cfg["port"] = port
+        self.cfg["baud"] = baud
+        save_cfg(self.cfg)
 
     def close_port(self):
         try:
             if self.ser:
+                self._flush_serial_now()
                 self.ser.close()
         finally:
             self.ser = None
@@ -395,13 +515,46 @@ class App(ctk.CTk):
     # ---------- Send ----------
     def _show_command(self, s: str):
         self.command_var.set(s)
-        if self._command_clear_after is not None:
+        # one pending timer; repeated commands just push the deadline out
+        self._command_clear_deadline = time.monotonic() + COMMAND_SHOW_S
+        if not self._command_clear_scheduled:
+            self._command_clear_scheduled = True
+            self.after(int(COMMAND_SHOW_S * 1000), self._maybe_clear_command)
+
+    def _maybe_clear_command(self):
+        remaining = self._command_clear_deadline - time.monotonic()
+        if remaining > 0:
+            self.after(max(1, int(remaining * 1000)), self._maybe_clear_command)
+            return
+        self._command_clear_scheduled = False
+        self.command_var.set("")
+
+    def _queue_write(self, payload: bytes):
+        # coalesce rapid sends into a single write (one USB frame)
+        self._tx_buf += payload
+        if self._tx_flush_after is None:
+            self._tx_flush_after = self.after(TX_COALESCE_MS, self._flush_serial)
+
+    def _flush_serial_now(self):
+        # cancel the pending timer so it can't fire after close/destroy
+        if self._tx_flush_after is not None:
             try:
-                self.after_cancel(self._command_clear_after)
+                self.after_cancel(self._tx_flush_after)
             except Exception:
                 pass
-            self._command_clear_after = None
-        self._command_clear_after = self.after(5000, lambda: self.command_var.set(""))
+        self._flush_serial()
+
+    def _flush_serial(self):
+        self._tx_flush_after = None
+        if not self._tx_buf:
+            return
+        data = bytes(self._tx_buf)
+        self._tx_buf.clear()
+        try:
+            if self.ser and self.ser.is_open:
+                self.ser.write(data)
+        except Exception as e:
+            self._set_status(f"Send failed: {e}", state="error")
 
     def send(self, data: str):
         if not self.ser or not self.ser.is_open:
@@ -409,21 +562,26 @@ class App(ctk.CTk):
             self._set_status("Port is not open!", state="error")
             return
         try:
-            self.ser.write(data.encode("ascii"))
+            self._queue_write(_CMD_BYTES.get(data) or data.encode("ascii"))
             self._show_command(data)
-            if data in {"M", "R", "P", "T", "S"}:
-                if data == "S":
-                    self._set_status("Idle", state="idle")
-                else:
-                    label = {"M":"MIC record","R":"RX record","P":"Play","T":"Transmit"}[data]
-                    self._set_status(label, state="ok")
+            if data == "S":
+                self._set_status("Idle", state="idle")
+            elif data in _CMD_STATUS:
+                self._set_status(_CMD_STATUS[data], state="ok")
         except Exception as e:
             self._set_status(f"Send failed: {e}", state="error")
 
     # ---------- Exit ----------
     def on_close(self):
+        if self._open_poll_after is not None:
+            try:
+                self.after_cancel(self._open_poll_after)
+            except Exception:
+                pass
+            self._open_poll_after = None
         try:
             if self.ser and self.ser.is_open:
+                self._flush_serial_now()
                 self.ser.close()
         finally:
             save_cfg(self.cfg)